@@ -38,12 +38,20 @@ from __future__ import annotations
 
 import re
 from dataclasses import dataclass
+from sys import intern
 from textwrap import dedent
-from typing import Any, Callable
+from typing import Any, Callable, Iterable
+from weakref import WeakKeyDictionary
 
 import yaml
 from docutils.parsers.rst import Directive
-from docutils.parsers.rst.directives import flag
+from docutils.parsers.rst.directives import (
+    flag,
+    nonnegative_int,
+    positive_int,
+    unchanged,
+    unchanged_required,
+)
 from docutils.parsers.rst.directives.misc import TestDirective
 from docutils.parsers.rst.states import MarkupError
 
@@ -51,6 +59,49 @@ from myst_parser.warnings_ import MystWarnings
 
 from .options import TokenizeError, options_to_items
 
+try:
+    # use the (much faster) libyaml based loader, if available
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # pragma: no cover
+    from yaml import SafeLoader as _SafeLoader
+
+_SIMPLE_OPTION_RE = re.compile(
+    r"([A-Za-z0-9_-]+) *:(?: +([^\s#'\"|>\0][^#\t\0\r\x85\u2028\u2029]*?))? *"
+)
+"""Matches a single line ``key: value`` option, with a plain (unquoted) value."""
+
+_SORTED_SPEC_CACHE: WeakKeyDictionary[
+    type[Directive], tuple[frozenset[str], list[str]]
+] = WeakKeyDictionary()
+"""Cache of the option names (and their sorted list), for each directive class."""
+
+_NO_FAST_PATH = object()
+"""Returned by a fast option convertor, if the generic convertor must be used."""
+
+_NOT_LOADED = object()
+"""Indicates that the YAML option block has not been loaded in advance."""
+
+_FAST_CONVERTORS: dict[Callable[[Any], Any], Callable[[Any], Any]] = {
+    # flag will error if value is not empty,
+    # but to be more permissive we allow any value
+    flag: lambda value: None,
+    unchanged: lambda value: "" if value is None else value,
+    unchanged_required: lambda value: _NO_FAST_PATH if value is None else value,
+    nonnegative_int: lambda value: (
+        int(value) if isinstance(value, str) and value.isdecimal() else _NO_FAST_PATH
+    ),
+    positive_int: lambda value: (
+        int(value)
+        if isinstance(value, str) and value.isdecimal() and int(value) > 0
+        else _NO_FAST_PATH
+    ),
+}
+"""Inlined versions of common option convertors, keyed by the convertor.
+
+These only handle values that trivially validate,
+and so skip the exception handling of the generic conversion.
+"""
+
 
 @dataclass
 class ParseWarnings:
@@ -61,6 +112,9 @@ class ParseWarnings:
 
 @dataclass
 class DirectiveParsingResult:
+    # note: dataclass(slots=True) requires Python 3.10
+    __slots__ = ("arguments", "body", "body_offset", "options", "warnings")
+
     arguments: list[str]
     """The arguments parsed from the first line."""
     options: dict
@@ -97,6 +151,32 @@ def parse_directive_text(
 
     :raises MarkupError: if there is a fatal parsing/validation error
     """
+    return _parse_directive_text(
+        directive_class,
+        first_line,
+        content,
+        line=line,
+        validate_options=validate_options,
+        additional_options=additional_options,
+    )
+
+
+def _parse_directive_text(
+    directive_class: type[Directive],
+    first_line: str,
+    content: str,
+    *,
+    line: int | None = None,
+    validate_options: bool = True,
+    additional_options: dict[str, str] | None = None,
+    split_block: _OptionsBlock | None = None,
+    loaded_yaml: Any = _NOT_LOADED,
+) -> DirectiveParsingResult:
+    """Parse (and validate) the full directive text, see `parse_directive_text`.
+
+    :param split_block: The content, already split into option block and body
+    :param loaded_yaml: The already loaded YAML option block (for ``as_yaml`` only)
+    """
     parse_warnings: list[ParseWarnings]
     options: dict[str, Any]
     body_lines: list[str]
@@ -105,19 +185,20 @@ def parse_directive_text(
 
     if directive_class.option_spec:
         # only look for an option block if there are possible options
-        # body, options, option_errors = _parse_directive_options(
         result = _parse_directive_options(
             content,
             directive_class,
             line=line,
             as_yaml=not validate_options,
             additional_options=additional_options,
+            split_block=split_block,
+            loaded_yaml=loaded_yaml,
         )
         parse_warnings = result.warnings
         has_options_block = result.has_options
         options = result.options
-        body_lines = result.content.splitlines()
-        content_offset = len(content.splitlines()) - len(body_lines)
+        body_lines = result.body
+        content_offset = result.body_offset
     else:
         parse_warnings = []
         has_options_block = False
@@ -156,9 +237,88 @@ def parse_directive_text(
     )
 
 
+def parse_directive_texts_batch(
+    items: Iterable[tuple[type[Directive], str, str]],
+) -> list[DirectiveParsingResult]:
+    """Parse multiple directive texts, with options parsed using the full YAML spec.
+
+    This is equivalent to calling `parse_directive_text`,
+    with ``validate_options=False``, for each item,
+    but loads all the option blocks as a single YAML stream,
+    rather than creating a new YAML loader per block.
+
+    :param items: (directive_class, first_line, content) for each directive
+
+    :raises MarkupError: if there is a fatal parsing/validation error
+    """
+    items = list(items)
+    # split each content once, and reuse the split when parsing
+    split_blocks: dict[int, _OptionsBlock] = {}
+    blocks: dict[int, str] = {}
+    for index, (directive_class, _, content) in enumerate(items):
+        if directive_class.option_spec:
+            split_block = split_blocks[index] = _split_options_block(content)
+            block = split_block.text
+            if block is not None and _is_batchable_yaml(block):
+                blocks[index] = block
+    loaded = _load_yaml_blocks(list(blocks.values()))
+    if loaded is None:
+        # fall back to loading each block separately (and reporting errors)
+        loaded_by_index: dict[int, Any] = {}
+    else:
+        loaded_by_index = dict(zip(blocks, loaded))
+    return [
+        _parse_directive_text(
+            directive_class,
+            first_line,
+            content,
+            validate_options=False,
+            split_block=split_blocks.get(index),
+            loaded_yaml=loaded_by_index.get(index, _NOT_LOADED),
+        )
+        for index, (directive_class, first_line, content) in enumerate(items)
+    ]
+
+
+def _is_batchable_yaml(block: str) -> bool:
+    """Check if a YAML block loads the same within a multi-document stream.
+
+    This is not the case if any line starts a directive, or starts/ends a document,
+    or if a line break must be added after a block that may contain a block scalar
+    (since this would change the scalar's value).
+    """
+    if block.startswith(("---", "...", "%")) or any(
+        marker in block for marker in ("\n---", "\n...", "\n%", "\ufeff")
+    ):
+        return False
+    return block.endswith("\n") or not ("|" in block or ">" in block)
+
+
+def _load_yaml_blocks(blocks: list[str]) -> list[Any] | None:
+    """Load multiple YAML blocks, as separate documents of a single YAML stream.
+
+    :returns: The loaded documents, or ``None`` if any block could not be loaded
+        as exactly one document
+    """
+    if not blocks:
+        return []
+    stream = "".join(
+        f"---\n{block}" if block.endswith("\n") else f"---\n{block}\n"
+        for block in blocks
+    )
+    try:
+        documents = list(yaml.load_all(stream, Loader=_SafeLoader))
+    except yaml.YAMLError:
+        return None
+    if len(documents) != len(blocks):
+        return None
+    return documents
+
+
 @dataclass
 class _DirectiveOptions:
-    content: str
+    body: list[str]
+    body_offset: int
     options: dict[str, Any]
     warnings: list[ParseWarnings]
     has_options: bool
@@ -170,40 +330,28 @@ def _parse_directive_options(
     as_yaml: bool,
     line: int | None,
     additional_options: dict[str, str] | None = None,
+    split_block: _OptionsBlock | None = None,
+    loaded_yaml: Any = _NOT_LOADED,
 ) -> _DirectiveOptions:
     """Parse (and validate) the directive option section.
 
-    :returns: (content, options, validation_errors)
+    :returns: (body, body_offset, options, validation_errors, has_options)
     """
-    options_block: None | str = None
-    if content.startswith("---"):
+    block = _split_options_block(content) if split_block is None else split_block
+    if block.fenced:
         line = None if line is None else line + 1
-        content = "\n".join(content.splitlines()[1:])
-        match = re.search(r"^-{3,}", content, re.MULTILINE)
-        if match:
-            options_block = content[: match.start()]
-            content = content[match.end() + 1 :]  # TODO advance line number
-        else:
-            options_block = content
-            content = ""
-        options_block = dedent(options_block)
-    elif content.lstrip().startswith(":"):
-        content_lines = content.splitlines()
-        yaml_lines = []
-        while content_lines:
-            if not content_lines[0].lstrip().startswith(":"):
-                break
-            yaml_lines.append(content_lines.pop(0).lstrip()[1:])
-        options_block = "\n".join(yaml_lines)
-        content = "\n".join(content_lines)
-
+    options_block = block.text
+    content_lines = block.body
+    body_offset = block.body_offset
     has_options_block = options_block is not None
 
     if as_yaml:
         yaml_errors: list[ParseWarnings] = []
         try:
-            yaml_options = yaml.safe_load(options_block or "") or {}
-        except (yaml.parser.ParserError, yaml.scanner.ScannerError):
+            if loaded_yaml is _NOT_LOADED:
+                loaded_yaml = yaml.load(options_block or "", Loader=_SafeLoader)
+            yaml_options = loaded_yaml or {}
+        except yaml.MarkedYAMLError:
             yaml_options = {}
             yaml_errors.append(
                 ParseWarnings(
@@ -221,18 +369,29 @@ def _parse_directive_options(
                     MystWarnings.DIRECTIVE_OPTION,
                 )
             )
-        return _DirectiveOptions(content, yaml_options, yaml_errors, has_options_block)
+        return _DirectiveOptions(
+            content_lines, body_offset, yaml_options, yaml_errors, has_options_block
+        )
 
     validation_errors: list[ParseWarnings] = []
 
     options: dict[str, str] = {}
+    simple_options = None
     if options_block is not None:
+        simple_options = _simple_options_to_dict(
+            options_block.split("\n") if block.lines is None else block.lines
+        )
+    if simple_options is not None:
+        options = simple_options
+    elif options_block is not None:
         try:
             _options, state = options_to_items(options_block)
-            options = dict(_options)
+            # interned keys match the (literal) option spec keys by identity
+            options = {intern(key): value for key, value in _options}
         except TokenizeError as err:
             return _DirectiveOptions(
-                content,
+                content_lines,
+                body_offset,
                 options,
                 [
                     ParseWarnings(
@@ -255,11 +414,14 @@ def _parse_directive_options(
     if issubclass(directive_class, TestDirective):
         # technically this directive spec only accepts one option ('option')
         # but since its for testing only we accept all options
-        return _DirectiveOptions(content, options, [], has_options_block)
+        return _DirectiveOptions(
+            content_lines, body_offset, options, [], has_options_block
+        )
 
     if additional_options:
         # The options block takes priority over additional options
-        options = {**additional_options, **options}
+        for key, default in additional_options.items():
+            options.setdefault(key, default)
 
     # check options against spec
     options_spec: dict[str, Callable] = directive_class.option_spec
@@ -275,10 +437,15 @@ def _parse_directive_options(
         if not value:
             # restructured text parses empty option values as None
             value = None
-        if convertor is flag:
-            # flag will error if value is not empty,
-            # but to be more permissive we allow any value
-            value = None
+        try:
+            fast_convertor = _FAST_CONVERTORS.get(convertor)
+        except TypeError:  # unhashable convertor
+            fast_convertor = None
+        if fast_convertor is not None:
+            converted_value = fast_convertor(value)
+            if converted_value is not _NO_FAST_PATH:
+                new_options[name] = converted_value
+                continue
         try:
             converted_value = convertor(value)
         except (ValueError, TypeError) as error:
@@ -296,13 +463,139 @@ def _parse_directive_options(
         validation_errors.append(
             ParseWarnings(
                 f"Unknown option keys: {sorted(unknown_options)} "
-                f"(allowed: {sorted(options_spec)})",
+                f"(allowed: {_sorted_option_names(directive_class, options_spec)})",
                 line,
                 MystWarnings.DIRECTIVE_OPTION,
             )
         )
 
-    return _DirectiveOptions(content, new_options, validation_errors, has_options_block)
+    return _DirectiveOptions(
+        content_lines, body_offset, new_options, validation_errors, has_options_block
+    )
+
+
+@dataclass
+class _OptionsBlock:
+    text: str | None
+    """The option block text, or ``None`` if there is no option block."""
+    lines: list[str] | None
+    """The option block lines, if already split."""
+    body: list[str]
+    """The lines of body content, after the option block."""
+    body_offset: int
+    """The number of lines to the start of the body content."""
+    fenced: bool
+    """Whether the option block is enclosed by ``---`` fences."""
+
+
+def _split_options_block(content: str) -> _OptionsBlock:
+    """Split the directive content into the option block and body lines."""
+    options_block: None | str = None
+    # the option block lines, if already split
+    option_lines: list[str] | None = None
+    content_lines = content.splitlines()
+    body_offset = 0
+    fenced = content.startswith("---")
+    if fenced:
+        fence = _find_yaml_fence(content_lines)
+        if fence is None:
+            options_block = "\n".join(content_lines[1:])
+            body_offset = len(content_lines)
+        else:  # TODO advance line number
+            index, fence_end = fence
+            # the block retains the line break before the closing fence
+            options_block = (
+                "\n".join(content_lines[1:index]) + "\n" if index > 1 else ""
+            )
+            fence_line = content_lines[index]
+            if fence_end < len(fence_line):
+                # any text after the closing fence is kept as body content
+                body_offset = index
+                content_lines[index] = fence_line[fence_end + 1 :]
+            else:
+                body_offset = index + 1
+        del content_lines[:body_offset]
+        options_block = _maybe_dedent(options_block)
+    elif content.lstrip().startswith(":"):
+        yaml_lines = []
+        for content_line in content_lines:
+            stripped = content_line.lstrip()
+            if not stripped.startswith(":"):
+                break
+            yaml_lines.append(stripped[1:])
+        option_lines = yaml_lines
+        options_block = "\n".join(yaml_lines)
+        body_offset = len(yaml_lines)
+        del content_lines[:body_offset]
+
+    if options_block is not None and content_lines and not content_lines[-1]:
+        # a trailing blank line after an options block is not part of the body
+        content_lines.pop()
+
+    return _OptionsBlock(
+        options_block, option_lines, content_lines, body_offset, fenced
+    )
+
+
+def _sorted_option_names(
+    directive_class: type[Directive], options_spec: dict[str, Callable]
+) -> list[str]:
+    """Return the sorted option names of a directive class (cached per class)."""
+    cached = _SORTED_SPEC_CACHE.get(directive_class)
+    # the option spec may be changed after first use, e.g. for `include`
+    if cached is not None and cached[0] == options_spec.keys():
+        return cached[1]
+    names = sorted(options_spec)
+    _SORTED_SPEC_CACHE[directive_class] = (frozenset(names), names)
+    return names
+
+
+def _find_yaml_fence(lines: list[str]) -> tuple[int, int] | None:
+    """Find the closing ``---`` fence of a YAML option block.
+
+    The first line (the opening fence) is skipped.
+
+    :returns: The index of the fence line and the end of its run of dashes,
+        or ``None`` if there is no closing fence
+    """
+    for index in range(1, len(lines)):
+        fence_line = lines[index]
+        if fence_line.startswith("---"):
+            end = 3
+            while end < len(fence_line) and fence_line[end] == "-":
+                end += 1
+            return index, end
+    return None
+
+
+def _maybe_dedent(text: str) -> str:
+    """Remove any common leading whitespace from every line in the text.
+
+    Option blocks are rarely indented, so first check (cheaply)
+    if any line starts with whitespace, before calling `textwrap.dedent`.
+    """
+    if text.startswith((" ", "\t")) or "\n " in text or "\n\t" in text:
+        return dedent(text)
+    return text
+
+
+def _simple_options_to_dict(lines: Iterable[str]) -> dict[str, str] | None:
+    """Parse an option block, made up only of single line ``key: value`` pairs.
+
+    This is a fast path for the most common form of option block,
+    which avoids the full option tokenizer.
+
+    :returns: The options, or ``None`` if the block is not of this simple form
+    """
+    options: dict[str, str] = {}
+    for option_line in lines:
+        if not option_line:
+            continue
+        match = _SIMPLE_OPTION_RE.fullmatch(option_line)
+        if match is None:
+            return None
+        options[intern(match[1])] = match[2] or ""
+    return options
 
 
 def parse_directive_arguments(
@@ -311,15 +604,16 @@ def parse_directive_arguments(
     """Parse (and validate) the directive argument section."""
     required = directive_cls.required_arguments
     optional = directive_cls.optional_arguments
-    arguments = arg_text.split()
+    limit = required + optional
+    # only split as far as needed to know if there are too many arguments
+    arguments = arg_text.split(None, limit) if limit else arg_text.split()
     if len(arguments) < required:
         raise MarkupError(f"{required} argument(s) required, {len(arguments)} supplied")
-    elif len(arguments) > required + optional:
+    elif len(arguments) > limit:
         if directive_cls.final_argument_whitespace:
-            arguments = arg_text.split(None, required + optional - 1)
+            arguments = arg_text.split(None, limit - 1)
         else:
             raise MarkupError(
-                f"maximum {required + optional} argument(s) allowed, "
-                f"{len(arguments)} supplied"
+                f"maximum {limit} argument(s) allowed, {len(arg_text.split())} supplied"
             )
     return arguments
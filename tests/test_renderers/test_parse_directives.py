@@ -3,12 +3,18 @@ from pathlib import Path
 
 import pytest
 import yaml
+from docutils.parsers.rst import directives
 from docutils.parsers.rst.directives.admonitions import Admonition, Note
 from docutils.parsers.rst.directives.body import Rubric
 from markdown_it import MarkdownIt
 from sphinx.directives.code import CodeBlock
 
-from myst_parser.parsers.directives import MarkupError, parse_directive_text
+from myst_parser.parsers.directives import (
+    MarkupError,
+    _simple_options_to_dict,
+    parse_directive_text,
+    parse_directive_texts_batch,
+)
 from myst_parser.parsers.options import TokenizeError, options_to_items
 
 FIXTURE_PATH = Path(__file__).parent.joinpath("fixtures")
@@ -28,6 +34,16 @@ def test_option_parsing(file_params):
     )
 
 
+@pytest.mark.param_file(FIXTURE_PATH / "option_parsing.yaml", "yaml")
+def test_simple_option_parsing(file_params):
+    """Test the fast path for simple options agrees with the full parser."""
+    result = _simple_options_to_dict(file_params.content.split("\n"))
+    if result is not None:
+        items, state = options_to_items(file_params.content)
+        assert result == dict(items)
+        assert not state.has_comments
+
+
 @pytest.mark.param_file(FIXTURE_PATH / "option_parsing_errors.yaml", "yaml")
 def test_option_parsing_errors(file_params):
     """Test parsing of directive options."""
@@ -91,6 +107,59 @@ def test_parsing_full_yaml():
     assert result.body == ["content"]
 
 
+def test_parsing_full_yaml_batch(monkeypatch):
+    """Batch parsing should give the same results as parsing individually."""
+    items = [
+        (Note, "", "---\na: [1]\n---\ncontent"),
+        (Note, "", "---\nb: |+\n  x\n---\ncontent"),
+        (Note, "", "---\nc: >\n  x\n  y\n---\ncontent"),
+        (Note, "", ":d: 2\n:e: |\n:  x\n\ncontent"),
+        (Note, "", ":f: 3\n\ncontent"),
+        (Note, "", "---\n...\n---\ncontent"),
+        (Rubric, "title", ""),
+    ]
+    expected = [
+        parse_directive_text(klass, first_line, content, validate_options=False)
+        for klass, first_line, content in items
+    ]
+    # only blocks that cannot be batched (or are missing) should be loaded individually
+    yaml_load = yaml.load
+    individual = []
+
+    def _load(stream, *args, **kwargs):
+        individual.append(stream)
+        return yaml_load(stream, *args, **kwargs)
+
+    monkeypatch.setattr(yaml, "load", _load)
+    batch = parse_directive_texts_batch(items)
+    assert individual == ["d: 2\ne: |\n  x", "...\n", ""]
+    assert batch == expected
+    assert [result.options for result in batch] == [
+        {"a": [1]},
+        {"b": "x\n"},
+        {"c": "x y\n"},
+        {"d": 2, "e": "x"},
+        {"f": 3},
+        {},
+        {},
+    ]
+
+
+def test_parsing_full_yaml_batch_fallback():
+    """Batch parsing should fall back to individual loading, for bad YAML."""
+    items = [
+        (Note, "", "---\na: [1]\n---\ncontent"),
+        (Note, "", "---\nbad: [\n---\ncontent"),
+    ]
+    batch = parse_directive_texts_batch(items)
+    assert batch == [
+        parse_directive_text(klass, first_line, content, validate_options=False)
+        for klass, first_line, content in items
+    ]
+    assert batch[0].options == {"a": [1]}
+    assert "bad YAML" in batch[1].warnings[0].msg
+
+
 def test_additional_options():
     """Allow additional options to be passed to a directive."""
     # this should be fine
@@ -120,3 +189,25 @@ def test_additional_options():
     )
     assert len(result.warnings) == 1
     assert "Unknown option" in result.warnings[0].msg
+
+
+def test_parsing_option_spec_changed():
+    """Changes to the option spec should apply to subsequent parses."""
+
+    class ExtraNote(Note):
+        option_spec = dict(Note.option_spec)
+
+    result = parse_directive_text(ExtraNote, "", ":extra: 3\nbody")
+    assert result.options == {}
+    assert "Unknown option keys: ['extra']" in result.warnings[0].msg
+    ExtraNote.option_spec["extra"] = directives.nonnegative_int
+    result = parse_directive_text(ExtraNote, "", ":extra: 3\nbody")
+    assert result.options == {"extra": 3}
+    assert not result.warnings
+    # the allowed options should also be updated, when the size is unchanged
+    result = parse_directive_text(ExtraNote, "", ":unknown: 3\nbody")
+    assert "'extra'" in result.warnings[0].msg
+    ExtraNote.option_spec["other"] = ExtraNote.option_spec.pop("extra")
+    result = parse_directive_text(ExtraNote, "", ":extra: 3\nbody")
+    assert "'other'" in result.warnings[0].msg
+    assert "'extra'" not in result.warnings[0].msg.split("allowed")[1]